@@ -1,3 +1,11 @@
+# Holidays observed by every company, as MM-DD (every year) or YYYY-MM-DD (one year only)
+HOLIDAYS = [
+    "01-26",  # Republic Day
+    "05-01",  # Maharashtra Day
+    "08-15",  # Independence Day
+    "10-02",  # Gandhi Jayanti
+]
+
 COMPANIES = [
     {
         "id": "company1",
@@ -10,7 +18,9 @@ COMPANIES = [
         "signature": "company1_signature.png",
         "hr_name": "Manisha Gidde",
         "hr_designation": "HR Manager",
-        "hr_email": "manisha@ilitecode.com"
+        "hr_email": "manisha@ilitecode.com",
+        # Company-specific holidays, same format as HOLIDAYS
+        "holidays": []
     },
     {
         "id": "company2",
@@ -23,7 +33,8 @@ COMPANIES = [
         "signature": "company2_signature.png",
         "hr_name": "Akshay Jadhav",
         "hr_designation": "HR Manager",
-        "hr_email": "akshay@arraycontech.com"
+        "hr_email": "akshay@arraycontech.com",
+        "holidays": []
     },
     # Add more companies as needed
 ]
\ No newline at end of file
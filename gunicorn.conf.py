@@ -0,0 +1,7 @@
+# Gunicorn picks this file up automatically from the working directory.
+
+
+def post_worker_init(worker):
+    """Warm each worker up (templates, print assets, WeasyPrint, PDF pool) before it serves requests."""
+    from app import warm_up
+    warm_up()
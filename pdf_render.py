@@ -0,0 +1,124 @@
+"""HTML to PDF conversion run by the PDF pool's worker processes.
+
+The pool's fork server preloads this module instead of app, so starting a
+worker process has no side effects (no Flask app, no database connection).
+Each task carries everything a conversion needs: the HTML, the stylesheet
+files and the static files the HTML references.
+"""
+import functools
+from urllib.parse import urlparse
+
+try:
+    from weasyprint import HTML, CSS
+    from weasyprint.text.fonts import FontConfiguration
+    from weasyprint.urls import URLFetcher, URLFetcherResponse
+except:
+    HTML = None
+    CSS = None
+    FontConfiguration = None
+    URLFetcher = object
+    URLFetcherResponse = None
+
+
+class VersionedImageCache(dict):
+    """WeasyPrint image cache (its ``cache=`` argument) that notices replaced images.
+
+    WeasyPrint looks images up by URL alone, so each URL is stored with the version
+    ``version_of(url)`` gives for it and no longer counts as cached once that changes.
+    URLs without a version (None) are cached as usual.
+    """
+
+    def __init__(self, version_of):
+        super().__init__()
+        self.version_of = version_of
+        self.versions = {}
+
+    def __contains__(self, key):
+        if not super().__contains__(key):
+            return False
+        return key not in self.versions or self.versions[key] == self.version_of(key)
+
+    def __setitem__(self, key, value):
+        version = self.version_of(key) if isinstance(key, str) else None
+        if version is not None:
+            self.versions[key] = version
+        else:
+            self.versions.pop(key, None)
+        super().__setitem__(key, value)
+
+
+def static_url_path(url):
+    """Path of an http(s) URL, the key of the task's static files; None for any other URL."""
+    parsed = urlparse(url)
+    return parsed.path if parsed.scheme in ('http', 'https') else None
+
+
+class TaskAssetFetcher(URLFetcher):
+    """WeasyPrint URL fetcher that serves the static files sent with the task from memory.
+
+    URLs the task did not include go over the network as usual.
+    """
+
+    def __init__(self, assets):
+        super().__init__()
+        self.assets = assets
+
+    def fetch(self, url, headers=None):
+        asset = self.assets.get(static_url_path(url))
+        if asset is not None:
+            body, mime_type, _ = asset
+            return URLFetcherResponse(url, body=body, headers={'Content-Type': mime_type})
+        return super().fetch(url, headers)
+
+
+_font_config = None
+_image_cache = None
+# Static files of the task being converted (a worker process converts one at a time)
+_task_assets = {}
+
+def font_config():
+    """FontConfiguration shared by every stylesheet and conversion in this process."""
+    global _font_config
+    if _font_config is None:
+        _font_config = FontConfiguration()
+    return _font_config
+
+@functools.lru_cache(maxsize=32)
+def parse_stylesheet(path, mtime):
+    return CSS(filename=path, font_config=font_config())
+
+def warm_up(stylesheets):
+    """Pool process initializer: parse every stylesheet, given as (path, mtime), before the first task."""
+    if CSS is None:
+        return
+    try:
+        for path, mtime in stylesheets:
+            parse_stylesheet(path, mtime)
+    except Exception as e:
+        # An initializer that raises breaks the whole pool; the tasks can still parse them
+        print("Stylesheet warm-up failed:", e)
+
+def task_asset_version(url):
+    asset = _task_assets.get(static_url_path(url))
+    return asset[2] if asset is not None else None
+
+def convert(html_content, stylesheets, assets, image_cache_entries):
+    """PDF bytes for ``html_content`` (None on failure).
+
+    ``stylesheets`` are the (path, mtime) of each CSS file to apply, and ``assets``
+    maps the URL path of each static file the HTML references to
+    (bytes, mime_type, version). Decoded images are kept between conversions
+    until a file's version changes or the cache reaches ``image_cache_entries``.
+    """
+    global _image_cache, _task_assets
+    if _image_cache is None or len(_image_cache) >= image_cache_entries:
+        _image_cache = VersionedImageCache(task_asset_version)
+    _task_assets = assets
+    try:
+        return HTML(string=html_content, url_fetcher=TaskAssetFetcher(assets)).write_pdf(
+            stylesheets=[parse_stylesheet(path, mtime) for path, mtime in stylesheets],
+            font_config=font_config(), cache=_image_cache
+        )
+    except Exception as e:
+        print("WeasyPrint error:", e)
+        return None